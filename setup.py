@@ -20,14 +20,12 @@ setup(
     install_requires=[
         "autopep8>=2.1.0",
         "clang-format>=18.1.2",
-        "icdiff",
         "jsbeautifier",
         "pycodestyle==2.12.0",
         "python-magic",
         "termcolor",
         "jinja2>=2.10",
     ],
-    dependency_links=["git+https://github.com/jeffkaufman/icdiff.git"],
     keywords=["style", "style50"],
     name="style50",
     py_requires=">=3.6",
@@ -12,9 +12,9 @@ except PackageNotFoundError:
     __version__ = "UNKNOWN"
 
 
-__all__ = ["Style50", "languages", "StyleCheck", "Error"]
+__all__ = ["Style50", "languages", "StyleCheck", "FileResult", "Error"]
 
-from ._api import Style50, StyleCheck, Error
+from ._api import Style50, StyleCheck, FileResult, Error
 
 # Ensure that all language checks are registered.
 from . import languages
@@ -5,6 +5,7 @@ import sys
 import traceback
 
 import argparse
+import itertools
 import termcolor
 
 from . import Style50, Error, __version__, renderer
@@ -27,10 +28,46 @@ sys.excepthook = excepthook
 excepthook.verbose = True
 
 
+def read_paths(stream, chunk_size=65536):
+    """
+    Lazily yield paths read from binary `stream`. Paths are NUL-delimited if a NUL
+    comes before the first newline, and newline-delimited (LF or CRLF) otherwise.
+    """
+    buffer = b""
+    sep = None
+    while True:
+        chunk = stream.read1(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+
+        # Determine delimiter from whichever comes first.
+        if sep is None:
+            nul, newline = buffer.find(b"\0"), buffer.find(b"\n")
+            if nul == newline == -1:
+                continue
+            sep = b"\0" if newline == -1 or 0 <= nul < newline else b"\n"
+
+        *paths, buffer = buffer.split(sep)
+        for path in paths:
+            # Tolerate CRLF line endings.
+            if sep == b"\n" and path.endswith(b"\r"):
+                path = path[:-1]
+            if path:
+                yield os.fsdecode(path)
+
+    if sep != b"\0" and buffer.endswith(b"\r"):
+        buffer = buffer[:-1]
+    if buffer:
+        yield os.fsdecode(buffer)
+
+
 def main():
     # Define command-line arguments.
     parser = argparse.ArgumentParser(prog="style50")
-    parser.add_argument("file", metavar="FILE", nargs="+", help="file or directory to lint")
+    parser.add_argument("file", metavar="FILE", nargs="*", help="file or directory to lint")
+    parser.add_argument("--files-from", action="store", type=argparse.FileType("rb"), metavar="FILE",
+                        help="read newline- or NUL-delimited paths to lint from FILE (or - for stdin)")
     parser.add_argument("-o", "--output", action="store", default="character",
                         choices=["character", "split", "unified", "score", "json", "html"], metavar="MODE",
                         help="output mode, which can be character (default), split, unified, score, or json")
@@ -45,8 +82,20 @@ def main():
                         help="paths/patterns to be ignored")
 
     args = parser.parse_args()
+    if not args.file and args.files_from is None:
+        parser.error("the following arguments are required: FILE")
+
+    paths = args.file
+    if args.files_from is not None:
+        paths = itertools.chain(paths, read_paths(args.files_from))
+
     ignore = args.ignore or filter(None, os.getenv("STYLE50_IGNORE", "").split(","))
-    Style50(args.output).run(args.file, ignore=ignore)
+    try:
+        Style50(args.output).run(paths, ignore=ignore)
+    finally:
+        # Close --files-from FILE (but leave stdin open).
+        if args.files_from not in (None, sys.stdin.buffer):
+            args.files_from.close()
 
 
 
@@ -1,8 +1,10 @@
 from abc import ABCMeta, abstractmethod
+from collections.abc import Mapping
 import errno
 import difflib
 import fcntl
 import fnmatch
+import functools
 import html
 import itertools
 import json
@@ -14,13 +16,12 @@ import sys
 import tempfile
 from termios import TIOCGWINSZ
 
-import icdiff
 import magic
 import termcolor
 
 from . import __version__, renderer
 
-__all__ = ["Style50", "StyleCheck", "Error"]
+__all__ = ["Style50", "StyleCheck", "FileResult", "Error"]
 
 
 
@@ -49,9 +50,6 @@ def get_terminal_size(fallback=(80, 24)):
     return columns, lines
 
 
-COLUMNS, LINES = get_terminal_size()
-
-
 class Style50:
     """
     Class that checks a list of files/directories for style.
@@ -62,20 +60,18 @@ class Style50:
     # Dict that maps substrings of libmagic's outputs to classes. Used as fallback when file extension unrecognized
     magic_map = {}
 
-    def __init__(self, output="character"):
-
-        self._warn_chars = set()
+    def __init__(self, output="character", columns=None):
 
-        # Set run function as apropriate for output mode.
+        # Set run function as apropriate for output mode (score mode never renders diffs).
         if output == "score":
-            self.diff = lambda old, new: ""
+            self.diff = None
         elif output in ["json", "html"]:
             self.diff = self.html_diff
         else:
             if output == "character":
                 self.diff = self.char_diff
             elif output == "split":
-                self.diff = self.split_diff
+                self.diff = functools.partial(self.split_diff, cols=columns)
             elif output == "unified":
                 self.diff = self.unified
             else:
@@ -107,7 +103,9 @@ class Style50:
 
     def check(self, paths, ignore=[]):
         """
-        Run checks on paths recursively, ignoring pataterns in ignore, returning a dict of results
+        Run checks on paths recursively, ignoring pataterns in ignore, returning a dict of results.
+        `paths` may be any iterable (e.g., a stream of paths), results are in the order paths are given.
+        The dict's "files" are FileResult objects (use FileResult.to_dict to serialize them).
         """
         try:
             # Translate each ignore pattern into a regex and compile it
@@ -116,12 +114,13 @@ class Style50:
             raise Error("failed to parse ignore pattern")
 
         # Creates a generator of all the files found recursively in `paths`, filtering out any ignored paths.
-        files = list(filter(lambda p: not any(reg.match(p) for reg in ignore),
-                            itertools.chain.from_iterable([path] if not os.path.isdir(path)
-                                                          else (os.path.join(root, file)
-                                                                for root, _, files in os.walk(path)
-                                                                for file in files)
-                                                          for path in paths)))
+        # `paths` is consumed lazily, so checking starts while paths are still being read.
+        files = filter(lambda p: not any(reg.match(p) for reg in ignore),
+                       itertools.chain.from_iterable([path] if not os.path.isdir(path)
+                                                     else (os.path.join(root, file)
+                                                           for root, _, files in os.walk(path)
+                                                           for file in files)
+                                                     for path in paths))
 
         diffs = 0
         lines = 0
@@ -130,22 +129,27 @@ class Style50:
             try:
                 results = self._check(file)
             except Error as e:
-                file_results.append({
-                    "name": file,
-                    "error": e.msg
-                })
+                file_results.append(FileResult(file, error=e.msg))
             else:
                 diffs += results.diffs
                 lines += results.lines
 
-                file_results.append({
-                    "name": file,
-                    "score": results.score,
-                    "comments": results.comment_ratio < results.COMMENT_MIN,
-                    "diff": "\n".join(self.diff(results.original, results.styled)),
-                    "warn_chars": sorted(self._warn_chars),
-                    "loc": lines
-                })
+                # Only keep the code around if the diff will be rendered
+                # (all but json output skip the diff of perfectly styled files).
+                if self.diff is None or (results.score == 1 and self.output != "json"):
+                    code = {}
+                else:
+                    code = {
+                        "original": results.original,
+                        "styled": results.styled,
+                        "differ": self.diff
+                    }
+
+                file_results.append(FileResult(file,
+                                               score=results.score,
+                                               comments=results.comment_ratio < results.COMMENT_MIN,
+                                               loc=lines,
+                                               **code))
 
         try:
             score = max(1 - diffs / lines, 0.0)
@@ -196,15 +200,131 @@ class Style50:
         return check(code)
 
     @staticmethod
-    def split_diff(old, new):
+    def split_diff(old, new, warn_chars=None, cols=None, context=5):
+        """
+        Returns a generator yielding the side-by-side diff of `old` and `new`, `cols` columns wide
+        (defaults to the width of the terminal), showing only changed lines and up to `context`
+        lines around them.
+        """
+        if old == new:
+            return
+
+        if cols is None:
+            cols, _ = get_terminal_size()
+
+        # Leave a column between the two sides.
+        width = max((cols - 1) // 2, 1)
+
+        # Diff raw lines so that tab/space changes register (tabs are expanded only for display).
+        old, new = old.splitlines(), new.splitlines()
+        groups = difflib.SequenceMatcher(None, old, new).get_grouped_opcodes(context)
+        for i, group in enumerate(groups):
+            # Separate non-contiguous hunks.
+            if i:
+                yield termcolor.colored("-" * (2 * width + 1), "blue")
+
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    pairs = (([(line, None)], [(line, None)]) for line in old[i1:i2])
+                elif tag == "delete":
+                    pairs = (([(line, "red")], []) for line in old[i1:i2])
+                elif tag == "insert":
+                    pairs = (([], [(line, "green")]) for line in new[j1:j2])
+                else:
+                    pairs = Style50._split_replace(old[i1:i2], new[j1:j2])
+
+                for left, right in pairs:
+                    for l, r in itertools.zip_longest(Style50._split_wrap(left, width),
+                                                      Style50._split_wrap(right, width), fillvalue=""):
+                        yield "{}{} {}".format(l, " " * (width - Style50._split_len(l)), r).rstrip()
+
+    @staticmethod
+    def _split_replace(old, new, max_fuzzy=32):
+        """
+        Returns a generator yielding the left and right runs of replaced lines `old` and `new`,
+        pairing up similar lines (as determined by difflib.ndiff) side-by-side. Blocks with more
+        than `max_fuzzy` lines on either side (e.g., a reindented file) are paired by position
+        instead, as ndiff's fuzzy matching is super-quadratic in the size of the block.
+        """
+        if len(old) > max_fuzzy or len(new) > max_fuzzy:
+            diffs = itertools.chain(("- " + line for line in old), ("+ " + line for line in new))
+        else:
+            diffs = difflib.ndiff(old, new)
+
+        removed, added = [], []
+        for diff in itertools.chain(diffs, [" "]):
+            if diff[0] == "?":
+                continue
+            # Flush runs of removed and added lines, pairing them up in order.
+            if diff[0] == " " or (diff[0] == "-" and added):
+                for a, b in itertools.zip_longest(removed, added):
+                    if a is None:
+                        yield [], [(b, "green")]
+                    elif b is None:
+                        yield [(a, "red")], []
+                    else:
+                        yield Style50._split_pair(a, b)
+                removed.clear()
+                added.clear()
+
+            if diff[0] == " ":
+                if len(diff) > 1:
+                    yield [(diff[2:], None)], [(diff[2:], None)]
+            else:
+                (removed if diff[0] == "-" else added).append(diff[2:])
+
+    @staticmethod
+    def _split_pair(old, new):
+        """
+        Returns the runs of (text, color) making up the left and right sides of changed line pair
+        `old` and `new`, coloring removed characters red, added green, and replaced yellow.
+        """
+        left, right = [], []
+        for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old, new).get_opcodes():
+            left.append((old[i1:i2], None if tag == "equal" else "red" if tag == "delete" else "yellow"))
+            right.append((new[j1:j2], None if tag == "equal" else "green" if tag == "insert" else "yellow"))
+        return left, right
+
+    @staticmethod
+    def _split_wrap(runs, width):
+        """
+        Returns a list of rendered rows, each at most `width` characters, of the runs of (text, color),
+        expanding tabs relative to the start of the line.
+        """
+        rows = []
+        row = []
+        length = 0
+        column = 0
+        for text, color in runs:
+            # Expand tabs to the next multiple of 8 columns.
+            parts = text.split("\t")
+            text = parts[0]
+            for part in parts[1:]:
+                text += " " * (8 - (column + len(text)) % 8) + part
+            column += len(text)
+
+            while text:
+                chunk, text = text[:width - length], text[width - length:]
+                row.append(termcolor.colored(chunk, color) if color else chunk)
+                length += len(chunk)
+                if length == width:
+                    rows.append("".join(row))
+                    row.clear()
+                    length = 0
+
+        if row or not rows:
+            rows.append("".join(row))
+        return rows
+
+    @staticmethod
+    def _split_len(row):
         """
-        Returns a generator yielding the side-by-side diff of `old` and `new`).
+        Returns the number of characters in `row`, excluding ANSI escape sequences.
         """
-        return map(lambda l: l.rstrip(),
-                   icdiff.ConsoleDiff(cols=COLUMNS).make_table(old.splitlines(), new.splitlines()))
+        return len(re.sub(r"\x1b[^m]*m", "", row))
 
     @staticmethod
-    def unified(old, new):
+    def unified(old, new, warn_chars=None):
         """
         Returns a generator yielding a unified diff between `old` and `new`.
         """
@@ -216,7 +336,7 @@ class Style50:
             else:
                 yield termcolor.colored(diff, "red" if diff[0] == "-" else "green", attrs=["bold"])
 
-    def html_diff(self, old, new):
+    def html_diff(self, old, new, warn_chars=None):
         """
         Return HTML formatted character-based diff between old and new (used for CS50 IDE).
         """
@@ -228,9 +348,10 @@ class Style50:
                 tags.append("<{}{}>".format(tag[0], "ins" if tag[1] == "+" else "del"))
             return "".join(tags)
 
-        return self._char_diff(old, new, html_transition, fmt=html.escape, prefix="<pre>", suffix="</pre>")
+        return self._char_diff(old, new, html_transition, fmt=html.escape, prefix="<pre>", suffix="</pre>",
+                               warn_chars=warn_chars)
 
-    def char_diff(self, old, new):
+    def char_diff(self, old, new, warn_chars=None):
         """
         Return color-coded character-based diff between `old` and `new`.
         """
@@ -239,13 +360,17 @@ class Style50:
                                           "-" else "on_green" if new_type == "+" else None)
             return "{}{}".format(termcolor.RESET, new_color[:-len(termcolor.RESET)])
 
-        return self._char_diff(old, new, color_transition)
+        return self._char_diff(old, new, color_transition, warn_chars=warn_chars)
 
-    def _char_diff(self, old, new, transition, fmt=lambda c: c, prefix=None, suffix=None):
+    def _char_diff(self, old, new, transition, fmt=lambda c: c, prefix=None, suffix=None, warn_chars=None):
         """
         Returns a char-based diff between `old` and `new` where each character
         is formatted by `fmt` and transitions between blocks are determined by `transition`.
+        Added/removed newlines and tabs are recorded in `warn_chars` (if given).
         """
+        if warn_chars is None:
+            warn_chars = set()
+
         if prefix is not None:
             yield prefix
 
@@ -268,7 +393,7 @@ class Style50:
 
             if d[2] == "\n":
                 if dtype != " ":
-                    self._warn_chars.add((dtype, "\\n"))
+                    warn_chars.add((dtype, "\\n"))
                     # Show added/removed newlines.
                     line += [fmt(r"\n"), transition(dtype, " ")]
 
@@ -281,7 +406,7 @@ class Style50:
             elif dtype != " " and d[2] == "\t":
                 # Show added/removed tabs.
                 line.append(fmt("\\t"))
-                self._warn_chars.add((dtype, "\\t"))
+                warn_chars.add((dtype, "\\t"))
             else:
                 line.append(fmt(d[2]))
 
@@ -295,6 +420,85 @@ class Style50:
             yield suffix
 
 
+class FileResult(Mapping):
+    """
+    Read-only mapping holding the results of checking a single file. The diff (and the
+    newlines/tabs it flags) is only rendered when first accessed, at which point the
+    original and styled code are released. Without a `differ`, the diff is empty.
+    """
+
+    __slots__ = ("name", "error", "score", "comments", "loc",
+                 "_original", "_styled", "_differ", "_diff", "_warn_chars", "_rendered")
+
+    def __init__(self, name, error=None, score=None, comments=False, loc=0,
+                 original=None, styled=None, differ=None):
+        self.name = name
+        self.error = error
+        self.score = score
+        self.comments = comments
+        self.loc = loc
+        self._original = original
+        self._styled = styled
+        self._differ = differ
+        self._diff = ""
+        self._warn_chars = []
+        self._rendered = differ is None
+
+    @property
+    def diff(self):
+        """
+        Diff between the original and styled code, rendered on first access.
+        """
+        self._render()
+        return self._diff
+
+    @property
+    def warn_chars(self):
+        """
+        Sorted list of (type, char) pairs of newlines/tabs added or removed by the diff.
+        """
+        self._render()
+        return self._warn_chars
+
+    def _render(self):
+        """
+        Render the diff (and record its warn chars) unless already rendered, releasing the code.
+        """
+        if self._rendered:
+            return
+
+        warn_chars = set()
+        self._diff = "\n".join(self._differ(self._original, self._styled, warn_chars))
+        self._warn_chars = sorted(warn_chars)
+        self._original = self._styled = self._differ = None
+        self._rendered = True
+
+    def to_dict(self):
+        """
+        Return a JSON-serializable dict of the results (rendering the diff if need be).
+        """
+        return {key: self[key] for key in self._keys()}
+
+    def _keys(self):
+        if self.error is not None:
+            return ("name", "error")
+        return ("name", "score", "comments", "diff", "warn_chars", "loc")
+
+    def __getitem__(self, key):
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __repr__(self):
+        return "FileResult({!r})".format(self.name)
+
+
 class StyleMeta(ABCMeta):
     """
     Metaclass which defines an abstract class and adds each extension that the
@@ -49,7 +49,7 @@ def to_ansi(files, score, version):
             if file["comments"]:
                 lines.append(termcolor.colored("{} consider adding more comments!".format(conjunction), "yellow"))
 
-            if (file["comments"] or file["warn_chars"]) and file["score"] != 1:
+            if file["score"] != 1 and (file["comments"] or file["warn_chars"]):
                 lines.append("")
         return "\n".join(lines)
 
@@ -64,7 +64,7 @@ def to_ansi_score(files, score, version):
 
 
 def to_json(files, score, version):
-    return json.dumps({"files": files, "score": score, "version": version}, indent=4)
+    return json.dumps({"files": [file.to_dict() for file in files], "score": score, "version": version}, indent=4)
 
 
 def to_html(files, score, version):